@@ -1,12 +1,28 @@
-from typing import Annotated, Tuple, Optional
+from typing import Annotated, Any, Awaitable, Callable, Tuple, Optional, TypeVar
 from urllib.parse import urlparse, urlunparse
+import asyncio
+import codecs
 import os
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 import json
 from datetime import datetime
+import ipaddress
+import multiprocessing
 import re
+import socket
+import threading
+import time
 
-import markdownify
-import readabilipy.simple_json
+import aiofiles
+import httpcore
+import lxml.html
+from httpx import AsyncClient, AsyncHTTPTransport, HTTPError, Limits, Timeout
+from httpx._utils import get_environment_proxies
+from readability import Document
+from readability.readability import Unparseable
 from mcp.shared.exceptions import McpError
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -26,6 +42,206 @@ from pydantic import BaseModel, Field, AnyUrl
 DEFAULT_USER_AGENT_AUTONOMOUS = "ModelContextProtocol/1.0 (Autonomous; +https://github.com/modelcontextprotocol/servers)"
 DEFAULT_USER_AGENT_MANUAL = "ModelContextProtocol/1.0 (User-Specified; +https://github.com/modelcontextprotocol/servers)"
 
+# Seconds the Jina Reader request runs alone before the original fetch is
+# started alongside it.
+JINA_HEAD_START = 0.2
+
+# Seconds Jina Reader is still waited for once the original fetch has
+# succeeded, since its markdown is preferred when it arrives in time.
+JINA_GRACE_PERIOD = 1.0
+
+# Content types simplified to markdown, and the number of leading body bytes
+# inspected for an HTML doctype or <html> tag when the type is anything else.
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml")
+HTML_SNIFF_BYTES = 512
+
+# Fetched content is kept this long (seconds) so paginated fetch calls for the
+# same URL do not download and simplify the page again.
+CONTENT_CACHE_TTL = 300
+CONTENT_CACHE_SIZE = 128
+# Total characters of content the cache may hold; a single page larger than a
+# quarter of this is not cached at all.
+CONTENT_CACHE_CHARS = 20_000_000
+
+# Seconds a resolved host address is reused before it is looked up again.
+DNS_CACHE_TTL = 60
+
+# Seconds a connection attempt gets before the next resolved address is tried
+# alongside it (Happy Eyeballs, RFC 8305).
+CONNECT_ATTEMPT_DELAY = 0.25
+
+# Number of fetches allowed to run at once; further requests wait in a queue.
+FETCH_WORKERS = 16
+
+T = TypeVar("T")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_MARKDOWN_ESCAPE_RE = re.compile(r"([*_])")
+_LEADING_SPACE_RE = re.compile(r"\n (?! )")
+# A lone trailing space is left over from collapsed whitespace; two or more
+# form a hard line break, unless a blank line follows anyway.
+_TRAILING_SPACE_RE = re.compile(r" +(?=\n)")
+_SPACE_BEFORE_BLANK_RE = re.compile(r" +(?=\n\n)")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_CODE_PLACEHOLDER_RE = re.compile(r"^((?:> ?| )*)\x00(\d+)\x00", re.MULTILINE)
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\-_.]')
+_FILENAME_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+_SKIPPED_TAGS = frozenset({"head", "script", "style", "noscript", "template", "iframe"})
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+_BLOCK_TAGS = frozenset({
+    "p", "div", "section", "article", "main", "header", "footer", "aside",
+    "nav", "figure", "figcaption", "dl", "dt", "dd", "details", "summary",
+    "address", "form", "fieldset", "body", "html",
+})
+
+
+def _markdown_text(text: str | None) -> str:
+    # Collapse whitespace and escape characters markdown would read as emphasis.
+    if not text:
+        return ""
+    return _MARKDOWN_ESCAPE_RE.sub(r"\\\1", _WHITESPACE_RE.sub(" ", text))
+
+
+def _markdown_children(el, code_blocks: list[str]) -> str:
+    parts = [_markdown_text(el.text)]
+    for child in el:
+        parts.append(_markdown_element(child, code_blocks))
+        parts.append(_markdown_text(child.tail))
+    return "".join(parts)
+
+
+def _markdown_inline(text: str, opening: str, closing: str) -> str:
+    # Wrap text in inline markers, keeping surrounding whitespace outside them
+    # so neighbouring words are not glued together.
+    inner = text.strip()
+    if not inner:
+        return text
+    leading = text[: len(text) - len(text.lstrip())]
+    trailing = text[len(text.rstrip()):]
+    return f"{leading}{opening}{inner}{closing}{trailing}"
+
+
+def _markdown_list(el, code_blocks: list[str]) -> str:
+    ordered = el.tag == "ol"
+    lines = []
+    for index, item in enumerate((li for li in el if li.tag == "li"), start=1):
+        marker = f"{index}. " if ordered else "- "
+        text = _markdown_children(item, code_blocks).strip()
+        text = _LEADING_SPACE_RE.sub("\n", _BLANK_LINES_RE.sub("\n\n", text))
+        first, *rest = text.split("\n")
+        indent = " " * len(marker)
+        lines.append("\n".join([marker + first] + [indent + line if line.strip() else "" for line in rest]))
+    return "\n\n" + "\n".join(lines) + "\n\n"
+
+
+def _table_rows(el):
+    # Only the table's own rows; rows of nested tables belong to their cells.
+    for child in el:
+        if child.tag == "tr":
+            yield child
+        elif child.tag in ("thead", "tbody", "tfoot"):
+            yield from (row for row in child if row.tag == "tr")
+
+
+def _markdown_table(el, code_blocks: list[str]) -> str:
+    rows = []
+    for row in _table_rows(el):
+        cells = [
+            " ".join(_markdown_children(cell, code_blocks).split()).replace("|", "\\|")
+            for cell in row
+            if cell.tag in ("td", "th")
+        ]
+        if cells:
+            rows.append(cells)
+    if not rows:
+        return ""
+    if any(ancestor.tag in ("td", "th") for ancestor in el.iterancestors()):
+        # Markdown cells cannot hold a table; flatten a nested one to text.
+        return " " + " ".join(cell for cells in rows for cell in cells) + " "
+    rows.insert(1, ["---"] * len(rows[0]))
+    return "\n\n" + "\n".join("| " + " | ".join(cells) + " |" for cells in rows) + "\n\n"
+
+
+def _markdown_element(el, code_blocks: list[str]) -> str:
+    tag = el.tag
+    if not isinstance(tag, str):
+        # Comments and processing instructions
+        return ""
+    tag = tag.lower()
+
+    if tag in _SKIPPED_TAGS:
+        return ""
+    if tag in _HEADING_TAGS:
+        # A heading must stay on one line, even if it contains <br>.
+        text = " ".join(_markdown_children(el, code_blocks).split())
+        return f"\n\n{'#' * int(tag[1])} {text}\n\n" if text else ""
+    if tag in _BLOCK_TAGS:
+        return f"\n\n{_markdown_children(el, code_blocks).strip()}\n\n"
+    if tag == "br":
+        return "  \n"
+    if tag == "hr":
+        return "\n\n---\n\n"
+    if tag == "pre":
+        # Code keeps its whitespace; stash it so the final clean-up passes
+        # cannot touch it.
+        code_blocks.append(f"```\n{el.text_content().strip(chr(10))}\n```")
+        return f"\n\n\x00{len(code_blocks) - 1}\x00\n\n"
+    if tag == "code":
+        # Inline code is literal: no escaping and no nested formatting.
+        text = _WHITESPACE_RE.sub(" ", el.text_content()).strip()
+        if not text:
+            return ""
+        fence = "``" if "`" in text else "`"
+        return f"{fence}{text}{fence}" if fence == "`" else f"{fence} {text} {fence}"
+    if tag in ("ul", "ol"):
+        return _markdown_list(el, code_blocks)
+    if tag == "table":
+        return _markdown_table(el, code_blocks)
+    if tag == "blockquote":
+        text = _markdown_children(el, code_blocks).strip()
+        text = _BLANK_LINES_RE.sub("\n\n", text)
+        return "\n\n" + "\n".join(f"> {line}" if line else ">" for line in text.split("\n")) + "\n\n"
+
+    text = _markdown_children(el, code_blocks)
+    if tag in ("strong", "b"):
+        return _markdown_inline(text, "**", "**")
+    if tag in ("em", "i"):
+        return _markdown_inline(text, "*", "*")
+    if tag == "a":
+        href = el.get("href")
+        return _markdown_inline(text, "[", f"]({href})") if href else text
+    if tag == "img":
+        src = el.get("src")
+        return f"![{el.get('alt', '')}]({src})" if src else ""
+    return text
+
+
+def html_to_markdown(html: str) -> str:
+    """Convert an HTML fragment to Markdown in a single walk of its lxml tree.
+
+    Args:
+        html: HTML fragment to convert
+
+    Returns:
+        Markdown rendering of the fragment
+    """
+    code_blocks: list[str] = []
+    markdown = _markdown_element(lxml.html.fromstring(html), code_blocks)
+    markdown = _LEADING_SPACE_RE.sub("\n", markdown)
+    markdown = _TRAILING_SPACE_RE.sub(lambda m: "  " if len(m.group()) > 1 else "", markdown)
+    markdown = _BLANK_LINES_RE.sub("\n\n", markdown)
+    markdown = _SPACE_BEFORE_BLANK_RE.sub("", markdown).strip()
+    return _CODE_PLACEHOLDER_RE.sub(
+        lambda m: _indent_code_block(code_blocks[int(m.group(2))], m.group(1)), markdown
+    )
+
+
+def _indent_code_block(block: str, prefix: str) -> str:
+    # Code blocks inside list items or quotes take the indentation (or "> "
+    # markers) of the line they were placed on.
+    return "\n".join(prefix + line if line else prefix.rstrip() for line in block.split("\n"))
+
 
 def extract_content_from_html(html: str) -> str:
     """Extract and convert HTML content to Markdown format.
@@ -36,98 +252,486 @@ def extract_content_from_html(html: str) -> str:
     Returns:
         Simplified markdown version of the content
     """
-    ret = readabilipy.simple_json.simple_json_from_html_string(
-        html, use_readability=True
-    )
-    if not ret["content"]:
+    try:
+        article = Document(html).summary(html_partial=True)
+    except Unparseable:
+        article = ""
+    # Readability returns an empty <body> when it keeps nothing.
+    content = html_to_markdown(article) if article else ""
+    if not content:
         return "<error>Page failed to be simplified from HTML</error>"
-    content = markdownify.markdownify(
-        ret["content"],
-        heading_style=markdownify.ATX,
-    )
     return content
 
+
+@dataclass
+class _CachedContent:
+    etag: str | None
+    last_modified: str | None
+    content: str
+    prefix: str
+    stored_at: float
+
+
+class _ContentCache:
+    """LRU cache of processed page content keyed by URL and raw flag.
+
+    Bounded both by entry count and by the total length of cached content.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = CONTENT_CACHE_SIZE,
+        ttl: float = CONTENT_CACHE_TTL,
+        maxchars: int = CONTENT_CACHE_CHARS,
+    ):
+        self._entries: OrderedDict[Tuple[str, bool], _CachedContent] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._maxchars = maxchars
+        self._chars = 0
+
+    def get(self, key: Tuple[str, bool]) -> Optional[_CachedContent]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.stored_at > self._ttl:
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Tuple[str, bool], entry: _CachedContent) -> None:
+        self._discard(key)
+        size = len(entry.content) + len(entry.prefix)
+        if size > self._maxchars // 4:
+            return
+        self._entries[key] = entry
+        self._chars += size
+        while len(self._entries) > self._maxsize or self._chars > self._maxchars:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: Tuple[str, bool]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._chars -= len(entry.content) + len(entry.prefix)
+
+
+_content_cache = _ContentCache()
+
+
+def _content_window(
+    content: str, prefix: str, start_index: int, max_length: int | None
+) -> Tuple[str, str, int]:
+    """Slice the requested window out of `content`, keeping its full length."""
+    end = None if max_length is None else start_index + max_length
+    return content[start_index:end], prefix, len(content)
+
+
 async def fetch_url(
-    url: str, user_agent: str, force_raw: bool = False, proxy_url: str | None = None
-) -> Tuple[str, str]:
+    client: AsyncClient,
+    url: str,
+    force_raw: bool = False,
+    executor: Executor | None = None,
+    start_index: int = 0,
+    max_length: int | None = None,
+) -> Tuple[str, str, int]:
     """
-    Fetch the URL and return the content in a form ready for the LLM, as well as a prefix string with status information.
+    Fetch the URL and return the content in a form ready for the LLM, a prefix string with status information, and the length of the full content.
+
+    HTML simplification runs on `executor` (the loop's default thread pool if
+    None) so it does not block the event loop.
+
+    Only the window of `max_length` characters starting at `start_index` is
+    returned. For raw fetches with `max_length` given, the download stops one
+    character past the end of the window, in which case the returned length
+    is a lower bound that still exceeds the end of the window. Pages that are
+    simplified are always read in full, since readability needs the whole
+    document; later windows of the same page are served from the cache.
+
+    Complete results are cached for CONTENT_CACHE_TTL seconds. Cached entries
+    with an ETag or Last-Modified header are revalidated with a conditional
+    request; entries without either are served as they are.
     """
-    from httpx import AsyncClient, HTTPError
+    read_limit = None
+    if force_raw and max_length is not None:
+        # One extra character tells the caller that more content exists.
+        read_limit = start_index + max_length + 1
 
-    async with AsyncClient(proxies=proxy_url) as client:
-        try:
-            response = await client.get(
-                url,
-                follow_redirects=True,
-                headers={"User-Agent": user_agent},
-                timeout=30,
-            )
-        except HTTPError as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to fetch {url}: {e!r}"))
-        if response.status_code >= 400:
-            raise McpError(ErrorData(
-                code=INTERNAL_ERROR,
-                message=f"Failed to fetch {url} - status code {response.status_code}",
-            ))
+    cache_key = (url, force_raw)
+    cached = _content_cache.get(cache_key)
+    headers = {}
+    if cached is not None:
+        if cached.etag is None and cached.last_modified is None:
+            return _content_window(cached.content, cached.prefix, start_index, max_length)
+        if cached.etag is not None:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified is not None:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    try:
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and cached is not None:
+                cached.stored_at = time.monotonic()
+                return _content_window(cached.content, cached.prefix, start_index, max_length)
+            if response.status_code >= 400:
+                raise McpError(ErrorData(
+                    code=INTERNAL_ERROR,
+                    message=f"Failed to fetch {url} - status code {response.status_code}",
+                ))
 
-        page_raw = response.text
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+            head = b""
+            chunks = []
+            read_chars = 0
+            complete = True
+            async for chunk in response.aiter_bytes():
+                if len(head) < HTML_SNIFF_BYTES:
+                    head += chunk[:HTML_SNIFF_BYTES - len(head)]
+                text = decoder.decode(chunk)
+                chunks.append(text)
+                read_chars += len(text)
+                if read_limit is not None and read_chars >= read_limit:
+                    complete = False
+                    break
+            if complete:
+                chunks.append(decoder.decode(b"", final=True))
+    except HTTPError as e:
+        raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to fetch {url}: {e!r}"))
 
     content_type = response.headers.get("content-type", "")
+    # Only declared HTML, or a body that opens like an HTML document, goes
+    # through readability; anything else (e.g. JSON from a server that sends
+    # no Content-Type) is returned raw. The sniff works on undecoded bytes,
+    # where bytes.__contains__ is a fast memory search.
+    head = head.lower()
     is_page_html = (
-        "<html" in page_raw[:100] or "text/html" in content_type or not content_type
+        content_type.lower().startswith(HTML_CONTENT_TYPES)
+        or b"<!doctype html" in head
+        or b"<html" in head
     )
 
+    page_raw = "".join(chunks)
+
     if is_page_html and not force_raw:
-        return extract_content_from_html(page_raw), ""
+        loop = asyncio.get_running_loop()
+        try:
+            content = await loop.run_in_executor(executor, extract_content_from_html, page_raw)
+        except BrokenProcessPool as e:
+            # An ExtractionPool has already replaced its dead workers, so only
+            # this page fails.
+            raise McpError(ErrorData(
+                code=INTERNAL_ERROR,
+                message=f"Failed to simplify {url}: the extraction worker exited unexpectedly",
+            )) from e
+        prefix = ""
+    else:
+        content = page_raw
+        prefix = f"Content type {content_type} cannot be simplified to markdown, but here is the raw content:\n"
 
-    return (
-        page_raw,
-        f"Content type {content_type} cannot be simplified to markdown, but here is the raw content:\n",
-    )
+    if complete:
+        _content_cache.put(cache_key, _CachedContent(
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            content=content,
+            prefix=prefix,
+            stored_at=time.monotonic(),
+        ))
+    return _content_window(content, prefix, start_index, max_length)
 
 
-async def fetch_with_jina_fallback(
-    url: str, user_agent: str, force_raw: bool = False, proxy_url: str | None = None
-) -> Tuple[str, str]:
-    """
-    Fetch URL using Jina Reader API first, fallback to original fetch logic if failed.
-    """
-    from httpx import AsyncClient, HTTPError
-    
-    # Try Jina Reader API first
+async def _fetch_via_jina(
+    client: AsyncClient, url: str
+) -> Optional[Tuple[str, str]]:
+    """Fetch URL through the Jina Reader API, returning None if it fails."""
     jina_url = f"https://r.jina.ai/{url}"
-    
-    async with AsyncClient(proxies=proxy_url) as client:
-        try:
-            response = await client.get(
-                jina_url,
-                follow_redirects=True,
-                headers={"User-Agent": user_agent},
-                timeout=30,
-            )
-            
-            if response.status_code == 200:
-                content = response.text
-                # Check if it's a Jina error response
+
+    try:
+        response = await client.get(jina_url)
+
+        if response.status_code == 200:
+            content = response.text
+            # Check if it's a Jina error response. Markdown bodies are only
+            # parsed as JSON if they could plausibly be JSON.
+            content_type = response.headers.get("content-type", "")
+            if content_type.startswith("application/json") or content[:64].lstrip().startswith("{"):
                 try:
                     error_data = json.loads(content)
                     if "code" in error_data and error_data.get("data") is None:
                         # This is an error response, fallback to original logic
-                        raise Exception(f"Jina API error: {error_data.get('message', 'Unknown error')}")
+                        return None
                 except json.JSONDecodeError:
                     # Not JSON, assume it's valid content
                     pass
-                
-                # Jina Reader already returns markdown content
-                return content, "Content fetched via Jina Reader API:\n"
-                
-        except Exception:
-            # Jina failed, fallback to original logic
+
+            # Jina Reader already returns markdown content
+            return content, "Content fetched via Jina Reader API:\n"
+
+    except Exception:
+        pass
+
+    return None
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    """Cancel a task whose result is no longer needed and silence its errors."""
+    if not task.done():
+        task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+async def fetch_with_jina_fallback(
+    client: AsyncClient,
+    url: str,
+    force_raw: bool = False,
+    executor: Executor | None = None,
+    head_start: float = JINA_HEAD_START,
+    grace_period: float = JINA_GRACE_PERIOD,
+) -> Tuple[str, str]:
+    """
+    Fetch URL using Jina Reader API first, fallback to original fetch logic if failed.
+
+    The original fetch is started in the background once Jina has had
+    `head_start` seconds to answer, and whichever succeeds first is used.
+    If the original fetch wins, Jina still gets `grace_period` seconds to
+    deliver its (preferred) markdown, so a slow or hanging Jina request no
+    longer holds up the result until its timeout.
+    """
+    jina_task = asyncio.create_task(_fetch_via_jina(client, url))
+    origin_task = None
+    try:
+        done, _ = await asyncio.wait({jina_task}, timeout=head_start)
+        if not done:
+            origin_task = asyncio.create_task(
+                fetch_url(client, url, force_raw, executor)
+            )
+            done, _ = await asyncio.wait(
+                {jina_task, origin_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if jina_task not in done and origin_task.exception() is None:
+                await asyncio.wait({jina_task}, timeout=grace_period)
+                if not jina_task.done() or jina_task.result() is None:
+                    content, prefix, _ = origin_task.result()
+                    return content, prefix
+
+        # Either Jina answered first or the original fetch failed; Jina's
+        # result decides whether the fallback is needed.
+        result = await jina_task
+        if result is not None:
+            return result
+
+        # Fallback to original fetch logic
+        if origin_task is None:
+            content, prefix, _ = await fetch_url(client, url, force_raw, executor)
+        else:
+            content, prefix, _ = await origin_task
+        return content, prefix
+    finally:
+        _discard_task(jina_task)
+        if origin_task is not None:
+            _discard_task(origin_task)
+
+
+def _close_connected_stream(task: asyncio.Task) -> None:
+    """Close the stream of a connection attempt that lost the race."""
+    if not task.cancelled() and task.exception() is None:
+        asyncio.ensure_future(task.result().aclose())
+
+
+class _CachedDNSBackend(httpcore.AnyIOBackend):
+    """Network backend that reuses resolved host addresses for a short time."""
+
+    def __init__(self, ttl: float = DNS_CACHE_TTL):
+        self._ttl = ttl
+        self._addresses: dict[str, Tuple[list[str], float]] = {}
+
+    async def resolve(self, host: str, timeout: float | None = None) -> list[str]:
+        cached = self._addresses.get(host)
+        now = time.monotonic()
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        try:
+            infos = await asyncio.wait_for(
+                asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM),
+                timeout,
+            )
+        except asyncio.TimeoutError as e:
+            raise httpcore.ConnectTimeout(f"Timed out resolving {host}") from e
+        except OSError as e:
+            raise httpcore.ConnectError(f"Failed to resolve {host}: {e}") from e
+        # Keep every address, in resolver preference order, without duplicates.
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        # Drop expired hosts so the cache only holds those seen within the TTL.
+        self._addresses = {h: entry for h, entry in self._addresses.items() if entry[1] > now}
+        self._addresses[host] = (addresses, now + self._ttl)
+        return addresses
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        try:
+            ipaddress.ip_address(host)
+        except ValueError:
             pass
-    
-    # Fallback to original fetch logic
-    return await fetch_url(url, user_agent, force_raw, proxy_url)
+        else:
+            return await super().connect_tcp(host, port, timeout, local_address, socket_options)
+
+        # Race the addresses Happy Eyeballs style: start the next one after
+        # CONNECT_ATTEMPT_DELAY or as soon as an attempt fails, all within a
+        # single `timeout`, so an unreachable address (e.g. IPv6 on an
+        # IPv4-only host) neither fails the connect nor multiplies its timeout.
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        def remaining() -> float | None:
+            return None if deadline is None else max(deadline - loop.time(), 0)
+
+        pending = list(await self.resolve(host, timeout))
+        attempts: set[asyncio.Task] = set()
+        error: BaseException | None = None
+        try:
+            while pending or attempts:
+                if pending:
+                    attempts.add(asyncio.create_task(
+                        super().connect_tcp(pending.pop(0), port, remaining(), local_address, socket_options)
+                    ))
+                wait = remaining()
+                if pending:
+                    wait = CONNECT_ATTEMPT_DELAY if wait is None else min(wait, CONNECT_ATTEMPT_DELAY)
+                done, attempts = await asyncio.wait(attempts, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                streams = []
+                for task in done:
+                    if task.exception() is None:
+                        streams.append(task.result())
+                    elif isinstance(task.exception(), (httpcore.ConnectError, httpcore.ConnectTimeout)):
+                        error = task.exception()
+                    else:
+                        raise task.exception()
+                if streams:
+                    for stream in streams[1:]:
+                        await stream.aclose()
+                    return streams[0]
+        finally:
+            for task in attempts:
+                task.cancel()
+                task.add_done_callback(_close_connected_stream)
+        # Nothing answered; look the host up afresh next time.
+        self._addresses.pop(host, None)
+        assert error is not None
+        raise error
+
+
+class CachedDNSTransport(AsyncHTTPTransport):
+    """HTTP transport that caches DNS lookups for DNS_CACHE_TTL seconds.
+
+    Only the address used to open new connections is cached; requests keep
+    their host name, so TLS verification and connection pooling still work
+    per host.
+    """
+
+    def __init__(self, *args: Any, dns_ttl: float = DNS_CACHE_TTL, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._dns = _CachedDNSBackend(dns_ttl)
+        self._pool._network_backend = self._dns
+
+    async def prewarm(self, *hosts: str) -> None:
+        """Resolve `hosts` ahead of their first request, ignoring failures."""
+        for host in hosts:
+            try:
+                await self._dns.resolve(host)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                pass
+
+
+class ExtractionPool(Executor):
+    """Process pool for HTML simplification that replaces itself when broken.
+
+    A worker that dies (crash, OOM kill) leaves a ProcessPoolExecutor broken
+    for good; the jobs running at the time fail with BrokenProcessPool, and
+    a fresh pool takes over for later ones.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool = self._new_pool()
+
+    @staticmethod
+    def _new_pool() -> ProcessPoolExecutor:
+        # Workers are spawned rather than forked because the stdio transport
+        # is already running threads by the time the first page is submitted.
+        return ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+    def _replace(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = self._new_pool()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future:
+        pool = self._pool
+        try:
+            future = pool.submit(fn, *args, **kwargs)
+        except BrokenProcessPool:
+            # Broken before its failed jobs reported back; start afresh.
+            self._replace(pool)
+            pool = self._pool
+            future = pool.submit(fn, *args, **kwargs)
+
+        def replace_if_broken(f: Future) -> None:
+            if not f.cancelled() and isinstance(f.exception(), BrokenProcessPool):
+                self._replace(pool)
+
+        future.add_done_callback(replace_if_broken)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+class FetchQueue:
+    """Run fetch coroutines on a fixed pool of worker tasks fed by a queue.
+
+    Bursts of tool calls are funnelled through `workers` concurrent fetches
+    instead of all hitting DNS and the connection pool at once.
+    """
+
+    def __init__(self, workers: int = FETCH_WORKERS):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._workers = [asyncio.create_task(self._work()) for _ in range(workers)]
+
+    async def submit(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Queue `func(*args, **kwargs)` and wait for its result."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((future, func, args, kwargs))
+        return await future
+
+    async def _work(self) -> None:
+        while True:
+            future, func, args, kwargs = await self._queue.get()
+            try:
+                if future.cancelled():
+                    continue
+                job = asyncio.create_task(func(*args, **kwargs))
+                # Stop the work if the caller gives up waiting for it.
+                future.add_done_callback(lambda f, job=job: f.cancelled() and job.cancel())
+                try:
+                    result = await job
+                except asyncio.CancelledError:
+                    if future.cancelled():
+                        continue
+                    raise
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                self._queue.task_done()
+
+    async def aclose(self) -> None:
+        """Stop the workers, cancelling any fetch in progress."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
 
 
 class Fetch(BaseModel):
@@ -174,6 +778,28 @@ class FetchAndSave(BaseModel):
     ]
 
 
+# Tool definitions never change, so build them (and their JSON schemas) once.
+_FETCH_SCHEMA = Fetch.model_json_schema()
+_FETCH_AND_SAVE_SCHEMA = FetchAndSave.model_json_schema()
+
+TOOLS = [
+    Tool(
+        name="fetch",
+        description="""Fetches a URL from the internet and optionally extracts its contents as markdown.
+
+Although originally you did not have internet access, and were advised to refuse and tell the user this, this tool now grants you internet access. Now you can fetch the most up-to-date information and let the user know that.""",
+        inputSchema=_FETCH_SCHEMA,
+    ),
+    Tool(
+        name="fetch_and_save",
+        description="""Fetches a URL from the internet using Jina Reader API (with fallback to standard fetch) and saves the content to a file.
+
+This tool first tries to fetch content using Jina Reader API for better markdown conversion, and falls back to the standard fetch method if Jina fails. Files are saved in the configured working directory. If no file path is specified, an automatic filename will be generated based on the URL.""",
+        inputSchema=_FETCH_AND_SAVE_SCHEMA,
+    ),
+]
+
+
 def generate_filename_from_url(url: str) -> str:
     """Generate a safe filename from URL."""
     # Extract domain and path
@@ -192,10 +818,10 @@ def generate_filename_from_url(url: str) -> str:
         filename_base = domain
     
     # Clean filename - remove invalid characters
-    filename_base = re.sub(r'[^\w\-_.]', '_', filename_base)
+    filename_base = _FILENAME_UNSAFE_RE.sub('_', filename_base)
     
     # Add timestamp to ensure uniqueness
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = datetime.now().strftime(_FILENAME_TIMESTAMP_FORMAT)
     
     return f"{filename_base}_{timestamp}.md"
 
@@ -219,24 +845,49 @@ async def serve(
     user_agent_autonomous = custom_user_agent or DEFAULT_USER_AGENT_AUTONOMOUS
     user_agent_manual = custom_user_agent or DEFAULT_USER_AGENT_MANUAL
 
-    @server.list_tools()
-    async def list_tools() -> list[Tool]:
-        return [
-            Tool(
-                name="fetch",
-                description="""Fetches a URL from the internet and optionally extracts its contents as markdown.
+    # One connection pool for the lifetime of the server so keep-alive
+    # connections (and their TLS sessions) are reused across tool calls.
+    # HTTP/2 lets concurrent fetches to the same origin share one connection.
+    limits = Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300)
+    transport = CachedDNSTransport(http2=True, limits=limits, proxy=proxy_url)
+    # A custom transport turns off httpx's HTTP(S)_PROXY / NO_PROXY handling,
+    # so without an explicit proxy mount the environment's proxies ourselves.
+    mounts = {}
+    if proxy_url is None:
+        mounts = {
+            pattern: None if env_proxy is None else CachedDNSTransport(
+                http2=True, limits=limits, proxy=env_proxy
+            )
+            for pattern, env_proxy in get_environment_proxies().items()
+        }
 
-Although originally you did not have internet access, and were advised to refuse and tell the user this, this tool now grants you internet access. Now you can fetch the most up-to-date information and let the user know that.""",
-                inputSchema=Fetch.model_json_schema(),
-            ),
-            Tool(
-                name="fetch_and_save",
-                description="""Fetches a URL from the internet using Jina Reader API (with fallback to standard fetch) and saves the content to a file.
+    def build_client(user_agent: str) -> AsyncClient:
+        # HTTP/2 and pool limits live on the transports; httpx ignores them
+        # on a client that is given a transport.
+        return AsyncClient(
+            transport=transport,
+            mounts=mounts,
+            headers={"User-Agent": user_agent},
+            timeout=Timeout(30),
+            follow_redirects=True,
+        )
 
-This tool first tries to fetch content using Jina Reader API for better markdown conversion, and falls back to the standard fetch method if Jina fails. Files are saved in the configured working directory. If no file path is specified, an automatic filename will be generated based on the URL.""",
-                inputSchema=FetchAndSave.model_json_schema(),
-            )
-        ]
+    # Tool calls and user-initiated prompts identify themselves differently;
+    # each gets a client with its User-Agent baked in, sharing the pool.
+    client = build_client(user_agent_autonomous)
+    manual_client = build_client(user_agent_manual)
+    # Name resolution happens on the proxy when one is configured.
+    dns_warmup = None
+    if proxy_url is None and not any(mounts.values()):
+        dns_warmup = asyncio.create_task(transport.prewarm("r.jina.ai"))
+    # Readability and markdown conversion are CPU bound; run them in worker
+    # processes so several pages can be simplified in parallel.
+    executor = ExtractionPool()
+    fetch_queue = FetchQueue()
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return TOOLS
 
     @server.list_prompts()
     async def list_prompts() -> list[Prompt]:
@@ -252,88 +903,100 @@ This tool first tries to fetch content using Jina Reader API for better markdown
             )
         ]
 
-    @server.call_tool()
-    async def call_tool(name, arguments: dict) -> list[TextContent]:
-        if name == "fetch":
-            try:
-                args = Fetch(**arguments)
-            except ValueError as e:
-                raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e)))
+    async def handle_fetch(arguments: dict) -> list[TextContent]:
+        try:
+            args = Fetch.model_validate(arguments)
+        except ValueError as e:
+            raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e)))
 
-            url = str(args.url)
-            if not url:
-                raise McpError(ErrorData(code=INVALID_PARAMS, message="URL is required"))
+        url = str(args.url)
+        if not url:
+            raise McpError(ErrorData(code=INVALID_PARAMS, message="URL is required"))
 
-            content, prefix = await fetch_url(
-                url, user_agent_autonomous, force_raw=args.raw, proxy_url=proxy_url
-            )
-            original_length = len(content)
-            if args.start_index >= original_length:
-                content = "<error>No more content available.</error>"
-            else:
-                truncated_content = content[args.start_index : args.start_index + args.max_length]
-                if not truncated_content:
-                    content = "<error>No more content available.</error>"
-                else:
-                    content = truncated_content
-                    actual_content_length = len(truncated_content)
-                    remaining_content = original_length - (args.start_index + actual_content_length)
-                    # Only add the prompt to continue fetching if there is still remaining content
-                    if actual_content_length == args.max_length and remaining_content > 0:
-                        next_start = args.start_index + actual_content_length
-                        content += f"\n\n<error>Content truncated. Call the fetch tool with a start_index of {next_start} to get more content.</error>"
-            return [TextContent(type="text", text=f"{prefix}Contents of {url}:\n{content}")]
+        content, prefix, original_length = await fetch_queue.submit(
+            fetch_url,
+            client,
+            url,
+            force_raw=args.raw,
+            executor=executor,
+            start_index=args.start_index,
+            max_length=args.max_length,
+        )
+        # Collect the pieces and join them once so a large window is copied
+        # a single time.
+        parts = [prefix, "Contents of ", url, ":\n"]
+        if not content:
+            parts.append("<error>No more content available.</error>")
+        else:
+            parts.append(content)
+            actual_content_length = len(content)
+            remaining_content = original_length - (args.start_index + actual_content_length)
+            # Only add the prompt to continue fetching if there is still remaining content
+            if actual_content_length == args.max_length and remaining_content > 0:
+                next_start = args.start_index + actual_content_length
+                parts.append(f"\n\n<error>Content truncated. Call the fetch tool with a start_index of {next_start} to get more content.</error>")
+        return [TextContent(type="text", text="".join(parts))]
+
+    async def handle_fetch_and_save(arguments: dict) -> list[TextContent]:
+        try:
+            args = FetchAndSave.model_validate(arguments)
+        except ValueError as e:
+            raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e)))
+
+        url = str(args.url)
+        if not url:
+            raise McpError(ErrorData(code=INVALID_PARAMS, message="URL is required"))
         
-        elif name == "fetch_and_save":
-            try:
-                args = FetchAndSave(**arguments)
-            except ValueError as e:
-                raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e)))
+        # Debug: Log received arguments
+        debug_info = f"Received arguments: url={url}, file_path={args.file_path}, raw={args.raw}"
+        
+        # Generate file path if not provided
+        if args.file_path and args.file_path.strip():
+            # Use provided file path, but ensure it's within work_dir
+            provided_path = args.file_path.strip()
+            if os.path.isabs(provided_path):
+                # If absolute path, use as-is (user responsibility)
+                file_path = provided_path
+                debug_info += f"\nUsing absolute path: {file_path}"
+            else:
+                # If relative path, make it relative to work_dir
+                file_path = os.path.join(work_dir, provided_path)
+                debug_info += f"\nUsing relative path in work_dir: {file_path}"
+        else:
+            # Auto-generate filename
+            filename = generate_filename_from_url(url)
+            file_path = os.path.join(work_dir, filename)
+            debug_info += f"\nAuto-generated filename: {file_path}"
+
+        try:
+            content, prefix = await fetch_queue.submit(
+                fetch_with_jina_fallback,
+                client, url, force_raw=args.raw, executor=executor
+            )
+            
+            # Create directory if it doesn't exist
+            await asyncio.to_thread(os.makedirs, os.path.dirname(file_path), exist_ok=True)
 
-            url = str(args.url)
-            if not url:
-                raise McpError(ErrorData(code=INVALID_PARAMS, message="URL is required"))
+            # Save content to file
+            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
+                await f.write(content)
             
-            # Debug: Log received arguments
-            debug_info = f"Received arguments: url={url}, file_path={args.file_path}, raw={args.raw}"
+            return [TextContent(type="text", text=f"Successfully fetched content from {url} and saved to {file_path}\n\nDebug info: {debug_info}\n\n{prefix}Content preview (first 500 chars):\n{content[:500]}{'...' if len(content) > 500 else ''}")]
             
-            # Generate file path if not provided
-            if args.file_path and args.file_path.strip():
-                # Use provided file path, but ensure it's within work_dir
-                provided_path = args.file_path.strip()
-                if os.path.isabs(provided_path):
-                    # If absolute path, use as-is (user responsibility)
-                    file_path = provided_path
-                    debug_info += f"\nUsing absolute path: {file_path}"
-                else:
-                    # If relative path, make it relative to work_dir
-                    file_path = os.path.join(work_dir, provided_path)
-                    debug_info += f"\nUsing relative path in work_dir: {file_path}"
-            else:
-                # Auto-generate filename
-                filename = generate_filename_from_url(url)
-                file_path = os.path.join(work_dir, filename)
-                debug_info += f"\nAuto-generated filename: {file_path}"
+        except Exception as e:
+            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to fetch and save: {str(e)}"))
 
-            try:
-                content, prefix = await fetch_with_jina_fallback(
-                    url, user_agent_autonomous, force_raw=args.raw, proxy_url=proxy_url
-                )
-                
-                # Create directory if it doesn't exist
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                
-                # Save content to file
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                return [TextContent(type="text", text=f"Successfully fetched content from {url} and saved to {file_path}\n\nDebug info: {debug_info}\n\n{prefix}Content preview (first 500 chars):\n{content[:500]}{'...' if len(content) > 500 else ''}")]
-                
-            except Exception as e:
-                raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to fetch and save: {str(e)}"))
-        
-        else:
+    tool_handlers = {
+        "fetch": handle_fetch,
+        "fetch_and_save": handle_fetch_and_save,
+    }
+
+    @server.call_tool()
+    async def call_tool(name, arguments: dict) -> list[TextContent]:
+        handler = tool_handlers.get(name)
+        if handler is None:
             raise McpError(ErrorData(code=INVALID_PARAMS, message=f"Unknown tool: {name}"))
+        return await handler(arguments)
 
     @server.get_prompt()
     async def get_prompt(name: str, arguments: dict | None) -> GetPromptResult:
@@ -343,7 +1006,9 @@ This tool first tries to fetch content using Jina Reader API for better markdown
         url = arguments["url"]
 
         try:
-            content, prefix = await fetch_url(url, user_agent_manual, proxy_url=proxy_url)
+            content, prefix, _ = await fetch_queue.submit(
+                fetch_url, manual_client, url, executor=executor
+            )
             # TODO: after SDK bug is addressed, don't catch the exception
         except McpError as e:
             return GetPromptResult(
@@ -365,5 +1030,13 @@ This tool first tries to fetch content using Jina Reader API for better markdown
         )
 
     options = server.create_initialization_options()
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, options, raise_exceptions=True)
\ No newline at end of file
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, options, raise_exceptions=True)
+    finally:
+        if dns_warmup is not None:
+            dns_warmup.cancel()
+        await fetch_queue.aclose()
+        await client.aclose()
+        await manual_client.aclose()
+        executor.shutdown(cancel_futures=True)
@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+import httpx
+
+from context_mcp_server.server import _CachedContent, _ContentCache, fetch_url
+
+
+def _entry(content):
+    return _CachedContent(etag=None, last_modified=None, content=content, prefix="", stored_at=time.monotonic())
+
+
+def test_cache_is_bounded_by_total_characters():
+    cache = _ContentCache(maxchars=100)
+    cache.put(("a", False), _entry("x" * 20))
+    cache.put(("b", False), _entry("x" * 20))
+    cache.put(("c", False), _entry("x" * 20))
+    cache.put(("d", False), _entry("x" * 20))
+    cache.put(("e", False), _entry("x" * 25))
+    assert cache.get(("a", False)) is None
+    assert cache.get(("b", False)) is not None
+    assert cache.get(("e", False)) is not None
+
+
+def test_oversized_content_is_not_cached():
+    cache = _ContentCache(maxchars=100)
+    cache.put(("a", False), _entry("x" * 26))
+    assert cache.get(("a", False)) is None
+
+
+def test_expired_entries_are_dropped():
+    cache = _ContentCache(ttl=5)
+    stale = _entry("old")
+    stale.stored_at -= 10
+    cache.put(("a", False), stale)
+    assert cache.get(("a", False)) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = _ContentCache(maxsize=2)
+    cache.put(("a", False), _entry("a"))
+    cache.put(("b", False), _entry("b"))
+    cache.get(("a", False))
+    cache.put(("c", False), _entry("c"))
+    assert cache.get(("b", False)) is None
+    assert cache.get(("a", False)) is not None
+    assert cache.get(("c", False)) is not None
+
+
+def _fetch_twice(url, respond):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return respond(request)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            first = await fetch_url(client, url)
+            second = await fetch_url(client, url)
+        return first, second
+
+    first, second = asyncio.run(run())
+    return first, second, requests
+
+
+def test_cached_content_is_revalidated_with_etag():
+    def respond(request):
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="hello", headers={"ETag": '"v1"'})
+
+    first, second, requests = _fetch_twice("http://etag.test/", respond)
+    assert second == first
+    assert first[0] == "hello"
+    assert len(requests) == 2
+    assert requests[1].headers["if-none-match"] == '"v1"'
+
+
+def test_changed_content_replaces_cached_entry():
+    bodies = iter(["one", "two"])
+
+    def respond(request):
+        return httpx.Response(200, text=next(bodies), headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    first, second, requests = _fetch_twice("http://modified.test/", respond)
+    assert requests[1].headers["if-modified-since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert (first[0], second[0]) == ("one", "two")
+
+
+def test_content_without_validators_is_served_from_cache():
+    first, second, requests = _fetch_twice("http://no-validators.test/", lambda request: httpx.Response(200, text="hi"))
+    assert second == first
+    assert len(requests) == 1
@@ -0,0 +1,40 @@
+import asyncio
+import os
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import httpx
+import pytest
+from mcp.shared.exceptions import McpError
+
+from context_mcp_server.server import ExtractionPool, fetch_url
+
+
+def test_pool_recovers_after_a_worker_dies():
+    pool = ExtractionPool()
+    try:
+        with pytest.raises(BrokenProcessPool):
+            pool.submit(os._exit, 1).result(timeout=30)
+        assert pool.submit(pow, 2, 3).result(timeout=30) == 8
+    finally:
+        pool.shutdown()
+
+
+class _BrokenExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+
+def test_fetch_maps_broken_pool_to_mcp_error():
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, html="<html><body><p>hi</p></body></html>")
+    )
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            await fetch_url(client, "http://broken-pool.test/", executor=_BrokenExecutor())
+
+    with pytest.raises(McpError, match="extraction worker"):
+        asyncio.run(run())
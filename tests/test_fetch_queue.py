@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from context_mcp_server.server import FetchQueue
+
+
+def test_results_and_errors_reach_the_caller():
+    async def fail():
+        raise ValueError("boom")
+
+    async def run():
+        queue = FetchQueue(workers=2)
+        try:
+            assert await queue.submit(asyncio.sleep, 0, result="done") == "done"
+            with pytest.raises(ValueError):
+                await queue.submit(fail)
+        finally:
+            await queue.aclose()
+
+    asyncio.run(run())
+
+
+def test_job_cancelled_while_queued_never_runs():
+    started = []
+
+    async def job(name, release=None):
+        started.append(name)
+        if release is not None:
+            await release.wait()
+        return name
+
+    async def run():
+        queue = FetchQueue(workers=1)
+        try:
+            release = asyncio.Event()
+            blocker = asyncio.create_task(queue.submit(job, "blocker", release))
+            queued = asyncio.create_task(queue.submit(job, "queued"))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            release.set()
+            assert await blocker == "blocker"
+            assert await queue.submit(job, "after") == "after"
+            assert queued.cancelled()
+        finally:
+            await queue.aclose()
+
+    asyncio.run(run())
+    assert started == ["blocker", "after"]
+
+
+def test_job_cancelled_while_running_is_stopped():
+    events = []
+
+    async def job():
+        events.append("started")
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    async def run():
+        queue = FetchQueue(workers=1)
+        try:
+            caller = asyncio.create_task(queue.submit(job))
+            await asyncio.sleep(0.01)
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            # The worker is free again for the next job.
+            assert await asyncio.wait_for(queue.submit(asyncio.sleep, 0, result="next"), 5) == "next"
+        finally:
+            await queue.aclose()
+
+    asyncio.run(run())
+    assert events == ["started", "cancelled"]
@@ -0,0 +1,74 @@
+from context_mcp_server.server import html_to_markdown
+
+
+def test_headings():
+    assert html_to_markdown("<div><h1>Title</h1><h3>Sub  title</h3></div>") == "# Title\n\n### Sub title"
+
+
+def test_heading_with_line_break_stays_on_one_line():
+    assert html_to_markdown("<h2>Title<br>two</h2>") == "## Title two"
+
+
+def test_paragraphs_and_inline_formatting():
+    html = "<div><p>Hello <b>bold</b> and <em>it</em>.</p><p>Second</p></div>"
+    assert html_to_markdown(html) == "Hello **bold** and *it*.\n\nSecond"
+
+
+def test_text_is_escaped():
+    assert html_to_markdown("<p>2*3 = snake_case</p>") == "2\\*3 = snake\\_case"
+
+
+def test_inline_code_is_not_escaped():
+    assert html_to_markdown("<p>Use <code>a_b*c</code></p>") == "Use `a_b*c`"
+
+
+def test_links_and_images():
+    html = '<p><a href="https://example.com/a_b">a link</a> <img src="i.png" alt="pic"></p>'
+    assert html_to_markdown(html) == "[a link](https://example.com/a_b) ![pic](i.png)"
+
+
+def test_unordered_and_ordered_lists():
+    html = "<div><ul><li>one</li><li>two</li></ul><ol><li>first</li><li>second</li></ol></div>"
+    assert html_to_markdown(html) == "- one\n- two\n\n1. first\n2. second"
+
+
+def test_nested_list_is_indented():
+    html = "<ul><li>one<ul><li>inner</li></ul></li><li>two</li></ul>"
+    assert html_to_markdown(html) == "- one\n\n  - inner\n- two"
+
+
+def test_table():
+    html = (
+        "<table><thead><tr><th>a</th><th>b</th></tr></thead>"
+        "<tbody><tr><td>1</td><td>2|3</td></tr></tbody></table>"
+    )
+    assert html_to_markdown(html) == "| a | b |\n| --- | --- |\n| 1 | 2\\|3 |"
+
+
+def test_nested_table_is_flattened_into_its_cell():
+    html = "<table><tr><td>a<table><tr><td>in</td></tr></table></td></tr></table>"
+    assert html_to_markdown(html) == "| a in |\n| --- |"
+
+
+def test_pre_keeps_whitespace():
+    html = "<div><p>Code:</p><pre><code>def f():\n    return  1\n\nx = 2\n</code></pre></div>"
+    assert html_to_markdown(html) == "Code:\n\n```\ndef f():\n    return  1\n\nx = 2\n```"
+
+
+def test_scripts_and_comments_are_dropped():
+    html = "<div><script>bad()</script><!-- note --><p>kept</p></div>"
+    assert html_to_markdown(html) == "kept"
+
+
+def test_whitespace_stays_outside_inline_markers():
+    html = '<p>Hello<strong> world</strong> and <a href="x">link </a>text</p>'
+    assert html_to_markdown(html) == "Hello **world** and [link](x) text"
+
+
+def test_line_break_is_a_hard_break():
+    assert html_to_markdown("<p>one<br>two <br> three</p><p>four</p>") == "one  \ntwo  \nthree\n\nfour"
+
+
+def test_pre_inside_list_item_is_indented():
+    html = "<ul><li>Run:<pre>make\n\nmake test</pre></li><li>done</li></ul>"
+    assert html_to_markdown(html) == "- Run:\n\n  ```\n  make\n\n  make test\n  ```\n- done"
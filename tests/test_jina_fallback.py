@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from mcp.shared.exceptions import McpError
+
+from context_mcp_server.server import fetch_with_jina_fallback
+
+
+def _fetch(url, jina, origin, head_start=0.01, grace_period=0.5):
+    async def handler(request):
+        if request.url.host == "r.jina.ai":
+            return await jina()
+        return await origin()
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await fetch_with_jina_fallback(
+                client, url, head_start=head_start, grace_period=grace_period
+            )
+
+    return asyncio.run(run())
+
+
+def _respond(status, text, delay=0.0):
+    async def respond():
+        await asyncio.sleep(delay)
+        return httpx.Response(status, text=text)
+
+    return respond
+
+
+def test_jina_result_is_used_when_it_answers():
+    content, prefix = _fetch("http://jina-ok.test/", _respond(200, "# jina"), _respond(200, "origin"))
+    assert content == "# jina"
+    assert "Jina" in prefix
+
+
+def test_hanging_jina_does_not_hold_up_origin_result():
+    started = time.monotonic()
+    content, _ = _fetch(
+        "http://jina-hangs.test/", _respond(200, "# jina", delay=30), _respond(200, "origin"), grace_period=0.05
+    )
+    assert content == "origin"
+    assert time.monotonic() - started < 5
+
+
+def test_jina_within_grace_period_is_preferred():
+    content, _ = _fetch(
+        "http://jina-grace.test/", _respond(200, "# jina", delay=0.1), _respond(200, "origin")
+    )
+    assert content == "# jina"
+
+
+def test_origin_is_used_when_jina_fails():
+    content, _ = _fetch("http://jina-fails.test/", _respond(500, "error"), _respond(200, "origin"))
+    assert content == "origin"
+
+
+def test_jina_is_awaited_when_origin_fails():
+    content, _ = _fetch(
+        "http://origin-fails.test/", _respond(200, "# jina", delay=0.1), _respond(500, "error")
+    )
+    assert content == "# jina"
+
+
+def test_both_failing_raises():
+    with pytest.raises(McpError):
+        _fetch("http://both-fail.test/", _respond(500, "error", delay=0.05), _respond(500, "error"))
@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+import httpcore
+import pytest
+from httpx._utils import get_environment_proxies
+
+from context_mcp_server.server import CachedDNSTransport, _CachedDNSBackend
+
+
+async def _serve_once():
+    server = await asyncio.start_server(lambda reader, writer: writer.close(), "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def _cached_backend(host, addresses):
+    backend = _CachedDNSBackend()
+    backend._addresses[host] = (addresses, time.monotonic() + 60)
+    return backend
+
+
+def test_connect_falls_through_unreachable_address_within_timeout():
+    async def run():
+        server, port = await _serve_once()
+        # 192.0.2.1 (TEST-NET-1) never answers, so it must not hold up 127.0.0.1.
+        backend = _cached_backend("example.test", ["192.0.2.1", "127.0.0.1"])
+        started = time.monotonic()
+        async with server:
+            stream = await backend.connect_tcp("example.test", port, timeout=5)
+            await stream.aclose()
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) < 2
+
+
+def test_connect_failure_drops_cached_addresses():
+    async def run():
+        server, port = await _serve_once()
+        server.close()
+        await server.wait_closed()
+        backend = _cached_backend("example.test", ["127.0.0.1"])
+        with pytest.raises(httpcore.ConnectError):
+            await backend.connect_tcp("example.test", port, timeout=5)
+        return backend._addresses
+
+    assert "example.test" not in asyncio.run(run())
+
+
+def test_dns_cache_prunes_expired_hosts():
+    async def run():
+        backend = _cached_backend("stale.test", ["192.0.2.1"])
+        backend._addresses["stale.test"] = (["192.0.2.1"], time.monotonic() - 1)
+        await backend.resolve("localhost")
+        return backend._addresses
+
+    addresses = asyncio.run(run())
+    assert "stale.test" not in addresses
+    assert "localhost" in addresses
+
+
+def test_private_httpx_hooks_are_available():
+    # CachedDNSTransport and the proxy mounts in serve() rely on these
+    # internals; fail loudly if an httpx/httpcore upgrade moves them.
+    transport = CachedDNSTransport()
+    assert transport._pool._network_backend is transport._dns
+    assert callable(get_environment_proxies)
+    assert isinstance(get_environment_proxies(), dict)